@@ -180,9 +180,6 @@ class RESTConnection(sap.rest.Connection):
         self.set_responses_iter(ok_responses() if responses is None else iter(responses))
 
     def set_responses(self, *responses):
-        if responses and isinstance(responses[0], list):
-            responses = responses[0]
-
         self.set_responses_iter(iter(responses))
 
     def set_responses_iter(self, responses_iter):
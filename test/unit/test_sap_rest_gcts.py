@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import copy
 import json
+import types
 import unittest
 from unittest.mock import Mock, call, patch, PropertyMock
 
@@ -61,50 +63,90 @@ class TestGCTSExceptionFactory(unittest.TestCase):
         self.assertEqual(str(new_error), str(expected_error))
 
 
-class GCTSTestSetUp:
+_REPO_URL = 'https://example.com/git/repo'
+_REPO_RID = 'repo-id'
 
-    def setUp(self):
-        self.repo_url = 'https://example.com/git/repo'
-        self.repo_rid = 'repo-id'
-        self.repo_name = 'the repo name'
-        self.repo_vsid = '6IT'
-        self.repo_data = {
-            'rid': self.repo_rid,
-            'name': self.repo_rid,
-            'role': 'SOURCE',
-            'type': 'GITHUB',
-            'vsid': '6IT',
-            'url': self.repo_url,
-            'connection': 'ssl',
-        }
+_REPO_DATA = types.MappingProxyType({
+    'rid': _REPO_RID,
+    'name': _REPO_RID,
+    'role': 'SOURCE',
+    'type': 'GITHUB',
+    'vsid': '6IT',
+    'url': _REPO_URL,
+    'connection': 'ssl',
+})
 
-        self.repo_request ={
-            'repository': self.repo_rid,
-            'data': {
-                'rid': self.repo_rid,
-                'name': self.repo_rid,
-                'role': 'SOURCE',
-                'type': 'GITHUB',
-                'vsid': '6IT',
-                'url': self.repo_url,
-                'connection': 'ssl',
-            }
-        }
 
-        self.repo_server_data = dict(self.repo_data)
-        self.repo_server_data['branch'] = 'the_branch'
-        self.repo_server_data['currentCommit'] = 'FEDCBA9876543210'
-        self.repo_server_data['status'] = 'READY'
-        self.repo_server_data['config'] = [
+def _build_server_data():
+    return {
+        **_REPO_DATA,
+        'branch': 'the_branch',
+        'currentCommit': 'FEDCBA9876543210',
+        'status': 'READY',
+        'config': [
             {'key': 'VCS_CONNECTION', 'value': 'SSL', 'category': 'Connection'},
             {'key': 'CLIENT_VCS_URI', 'category': 'Repository'}
         ]
+    }
+
+
+_REPO_SERVER_DATA = _build_server_data()
+
+_GET_REPO_REQ = Request.get_json(uri=f'repository/{_REPO_RID}')
+_CLONE_REPO_REQ = Request.post(uri=f'repository/{_REPO_RID}/clone')
+_GET_USER_REQ = Request.get_json(uri='user')
+
+_GET_REPO_ERR_MSGS = LogBuilder(exception='Get Repo Error').get_contents()
+_SET_CONFIG_ERR_MSGS = LogBuilder(exception='Set Config Error').get_contents()
+_GET_CONFIG_ERR_MSGS = LogBuilder(exception='Get Config Error').get_contents()
+_CLONE_ERR_MSGS = LogBuilder(exception='Clone Error').get_contents()
+_CHECKOUT_ERR_MSGS = LogBuilder(exception='Checkout Error').get_contents()
+_DELETE_ERR_MSGS = LogBuilder(exception='Delete Error').get_contents()
+_LOG_ERR_MSGS = LogBuilder(exception='Log Error').get_contents()
+_PULL_ERR_MSGS = LogBuilder(exception='Pull Error').get_contents()
+_FETCH_ERR_MSGS = LogBuilder(exception='Fetch Error').get_contents()
+
+_ERR_NO_BRANCHES = "gCTS response does not contain 'branches'"
+_ERR_NO_RESULT = "gCTS response does not contain 'result'"
+_ERR_NO_USER = "gCTS response does not contain 'user'"
+_ERR_WAIT_TIMEOUT = 'Waiting for the repository to be in READY state timed out\n500\nTest HTTP Request Exception'
+
 
+class GCTSTestSetUp:
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.repo_url = _REPO_URL
+        cls.repo_rid = _REPO_RID
+        cls.repo_name = 'the repo name'
+        cls.repo_vsid = '6IT'
+
+        # Shared by all tests - use copy.deepcopy() before modifying them
+        # (also indirectly via Repository which keeps the given data).
+        cls.repo_data = _REPO_DATA
+        cls.repo_server_data = _REPO_SERVER_DATA
+
+    def setUp(self):
         self.conn = RESTConnection()
 
+    def _repo_with(self, **overrides):
+        return {**self.repo_server_data, **overrides}
+
+    def _build_repo_request(self, **data_overrides):
+        return {
+            'repository': self.repo_rid,
+            'data': {**self.repo_data, **data_overrides}
+        }
+
 
 class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
 
+    def repo_with_responses(self, *responses, data=None):
+        self.conn.set_responses(*responses)
+        return sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=data)
+
     def test_wipe_data(self):
         repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data={})
         repo.wipe_data()
@@ -137,117 +179,56 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
     def test_properties_fetch(self):
         response = {'result': self.repo_server_data}
 
-        self.conn.set_responses([Response.with_json(json=response, status_code=200)])
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-
-        self.assertEqual(repo.status, self.repo_server_data['status'])
-        self.assertEqual(repo.rid, self.repo_server_data['rid'])
-        self.assertEqual(repo.url, self.repo_server_data['url'])
-        self.assertEqual(repo.branch, self.repo_server_data['branch'])
-
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}'), self)
-
-    # exactly the same as test_properties_fetch but with 500 as status
-    # testing gCTS' behavior for repos whose remote does not exist
-    def test_properties_fetch_with_500(self):
-        response = {'result': self.repo_server_data}
-
-        self.conn.set_responses([Response.with_json(json=response, status_code=500)])
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-
-        self.assertEqual(repo.status, self.repo_server_data['status'])
-        self.assertEqual(repo.rid, self.repo_server_data['rid'])
-        self.assertEqual(repo.url, self.repo_server_data['url'])
-        self.assertEqual(repo.branch, self.repo_server_data['branch'])
-
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}'), self)
-
-    def test_properties_fetch_error(self):
-        messages = LogBuilder(exception='Get Repo Error').get_contents()
-        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-        with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
-            unused = repo.name
-
-        self.assertEqual(str(caught.exception), 'gCTS exception: Get Repo Error')
-
-    def test_create_no_self_data_no_config(self):
-        self.conn.set_responses(
-            Response.with_json(status_code=201, json={'repository': self.repo_server_data})
-        )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-        repo.create(self.repo_url, self.repo_vsid)
-
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.post_json(uri=f'repository', body=self.repo_request, accept='application/json'),
-                                       self, json_body=True)
-
-    def test_create_with_config_instance_none(self):
-        self.conn.set_responses(
-            Response.with_json(status_code=201, json={'repository': self.repo_server_data})
-        )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-        repo.create(self.repo_url, self.repo_vsid, config={'THE_KEY': 'THE_VALUE'})
-
-        repo_request = dict(self.repo_request)
-        repo_request['data']['config'] = [{
-            'key': 'THE_KEY', 'value': 'THE_VALUE'
-        }]
-
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.post_json(uri=f'repository', body=repo_request, accept='application/json'),
-                                       self, json_body=True)
-
-    def test_create_with_config_update_instance(self):
-        self.conn.set_responses(
-            Response.with_json(status_code=201, json={'repository': self.repo_server_data})
-        )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data={
-            'config': [
-                {'key': 'first_key', 'value': 'first_value'},
-                {'key': 'third_key', 'value': 'third_value'}
-            ]
-        })
-
-        repo.create(self.repo_url, self.repo_vsid, config={'second_key': 'second_value', 'third_key': 'fourth_value'})
-
-        repo_request = dict(self.repo_request)
-        repo_request['data']['config'] = [
-            {'key': 'first_key', 'value': 'first_value'},
-            {'key': 'third_key', 'value': 'fourth_value'},
-            {'key': 'second_key', 'value': 'second_value'},
+        # 500 tests gCTS' behavior for repos whose remote does not exist
+        for status_code in [200, 500]:
+            with self.subTest(status_code=status_code):
+                self.conn = RESTConnection()
+                repo = self.repo_with_responses(Response.with_json(json=response, status_code=status_code))
+
+                self.assertEqual(repo.status, self.repo_server_data['status'])
+                self.assertEqual(repo.rid, self.repo_server_data['rid'])
+                self.assertEqual(repo.url, self.repo_server_data['url'])
+                self.assertEqual(repo.branch, self.repo_server_data['branch'])
+
+                self.assertEqual(len(self.conn.execs), 1)
+                self.conn.execs[0].assertEqual(_GET_REPO_REQ, self)
+
+    def test_create(self):
+        # (create() keyword arguments, repository data, expected request data overrides)
+        cases = [
+            ({},
+             None,
+             {}),
+            ({'config': {'THE_KEY': 'THE_VALUE'}},
+             None,
+             {'config': [{'key': 'THE_KEY', 'value': 'THE_VALUE'}]}),
+            ({'config': {'second_key': 'second_value', 'third_key': 'fourth_value'}},
+             {'config': [{'key': 'first_key', 'value': 'first_value'},
+                         {'key': 'third_key', 'value': 'third_value'}]},
+             {'config': [{'key': 'first_key', 'value': 'first_value'},
+                         {'key': 'third_key', 'value': 'fourth_value'},
+                         {'key': 'second_key', 'value': 'second_value'}]}),
+            ({'role': 'TARGET', 'typ': 'GIT'},
+             None,
+             {'role': 'TARGET', 'type': 'GIT'}),
         ]
 
         self.maxDiff = None
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.post_json(uri=f'repository', body=repo_request, accept='application/json'),
-                                       self, json_body=True)
+        for create_kwargs, data, data_overrides in cases:
+            with self.subTest(create_kwargs=create_kwargs, data=data):
+                self.conn = RESTConnection()
+                repo = self.repo_with_responses(
+                    Response.with_json(status_code=201, json={'repository': self.repo_server_data}),
+                    data=data
+                )
 
-    def test_create_with_role_and_type(self):
-        self.conn.set_responses(
-            Response.with_json(status_code=201, json={'repository': self.repo_server_data})
-        )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
+                repo.create(self.repo_url, self.repo_vsid, **create_kwargs)
 
-        repo.create(self.repo_url, self.repo_vsid, role='TARGET', typ='GIT')
+                repo_request = self._build_repo_request(**data_overrides)
 
-        repo_request = dict(self.repo_request)
-        repo_request['data']['role'] = 'TARGET'
-        repo_request['data']['type'] = 'GIT'
-
-        self.maxDiff = None
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.post_json(uri=f'repository', body=repo_request, accept='application/json'),
-                                       self, json_body=True)
+                self.assertEqual(len(self.conn.execs), 1)
+                self.conn.execs[0].assertEqual(Request.post_json(uri=f'repository', body=repo_request, accept='application/json'),
+                                               self, json_body=True)
 
     # Covered by TestgCTSSimpleClone
     #def test_create_generic_error(self):
@@ -257,123 +238,92 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
     #def test_create_already_exists_error(self):
     #    pass
 
-    def test_set_config_success(self):
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-        repo.set_config('THE_KEY', 'the value')
-        self.assertEqual(repo.get_config('THE_KEY'), 'the value')
-
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.post_json(uri=f'repository/{self.repo_rid}/config', body={'key': 'THE_KEY', 'value': 'the value'}), self, json_body=True)
-
-    def test_set_config_success_overwrite(self):
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-        repo.set_config('VCS_CONNECTION', 'git')
-        self.assertEqual(repo.get_config('VCS_CONNECTION'), 'git')
-
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.post_json(uri=f'repository/{self.repo_rid}/config', body={'key': 'VCS_CONNECTION', 'value': 'git'}), self, json_body=True)
-
-    def test_set_config_error(self):
-        messages = LogBuilder(exception='Set Config Error').get_contents()
-
-        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-
-        with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
-            repo.set_config('THE_KEY', 'the value')
-
-        self.assertEqual(str(caught.exception), 'gCTS exception: Set Config Error')
-
-    def test_get_config_cached_ok(self):
-        repo = sap.rest.gcts.remote_repo.Repository(None, self.repo_rid, data={
-            'config': [
-                {'key': 'THE_KEY', 'value': 'the value', 'category': 'connection'}
-            ]
-        })
-
-        value = repo.get_config('THE_KEY')
-        self.assertEqual(value, 'the value')
-
-    def test_get_config_no_config_ok(self):
-        self.conn.set_responses(Response.with_json(status_code=200, json={'result':self.repo_server_data}))
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-
-        # This will fetch repo data from the server
-        value = repo.get_config('VCS_CONNECTION')
-        self.assertEqual(value, 'SSL')
+    def test_set_config(self):
+        # (repository data, key, value)
+        cases = [
+            (None, 'THE_KEY', 'the value'),
+            (copy.deepcopy(self.repo_server_data), 'VCS_CONNECTION', 'git'),
+        ]
 
-        # The second request does not causes an HTTP request
-        value = repo.get_config('VCS_CONNECTION')
-        self.assertEqual(value, 'SSL')
+        for data, key, value in cases:
+            with self.subTest(key=key):
+                self.conn = RESTConnection()
+                repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=data)
+                repo.set_config(key, value)
+                self.assertEqual(repo.get_config(key), value)
+
+                self.assertEqual(len(self.conn.execs), 1)
+                self.conn.execs[0].assertEqual(Request.post_json(uri=f'repository/{self.repo_rid}/config', body={'key': key, 'value': value}), self, json_body=True)
+
+    def test_get_config(self):
+        # (repository data, response JSON, key, expected value, expected request URI, expected configuration)
+        cases = [
+            # Cached value does not cause an HTTP request
+            ({'config': [{'key': 'THE_KEY', 'value': 'the value', 'category': 'connection'}]},
+             None,
+             'THE_KEY', 'the value',
+             None,
+             {'THE_KEY': 'the value'}),
+            # No cached data: the whole repository data is fetched from the server
+            (None,
+             {'result': self.repo_server_data},
+             'VCS_CONNECTION', 'SSL',
+             f'repository/{self.repo_rid}',
+             {'VCS_CONNECTION': 'SSL', 'CLIENT_VCS_URI': ''}),
+            # Unknown key: only the configuration key value is fetched from the server
+            # and the update of keys does not break the cache
+            (copy.deepcopy(self.repo_server_data),
+             {'result': {'value': 'the value'}},
+             'THE_KEY', 'the value',
+             f'repository/{self.repo_rid}/config/THE_KEY',
+             {'VCS_CONNECTION': 'SSL', 'CLIENT_VCS_URI': '', 'THE_KEY': 'the value'}),
+        ]
 
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}'), self)
+        for data, response, key, expected_value, expected_uri, expected_config in cases:
+            with self.subTest(key=key, uri=expected_uri):
+                self.conn = RESTConnection()
+                repo = self.repo_with_responses(Response.with_json(status_code=200, json=response), data=data)
 
-    def test_get_config_no_key_ok(self):
-        self.conn.set_responses(Response.with_json(status_code=200, json={'result': {'value': 'the value'}}))
+                value = repo.get_config(key)
+                self.assertEqual(value, expected_value)
 
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
+                # The second request does not causes an HTTP request
+                value = repo.get_config(key)
+                self.assertEqual(value, expected_value)
 
-        # This will fetch the configruation key value from the server
-        value = repo.get_config('THE_KEY')
-        self.assertEqual(value, 'the value')
+                self.assertEqual(repo.configuration, expected_config)
 
-        # The second request does not causes an HTTP request
-        value = repo.get_config('THE_KEY')
-        self.assertEqual(value, 'the value')
-
-        # The update of keys did not break the cache
-        value = repo.get_config('VCS_CONNECTION')
-        self.assertEqual(value, 'SSL')
-
-        self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}/config/THE_KEY'), self)
+                if expected_uri is None:
+                    self.assertEqual(self.conn.execs, [])
+                else:
+                    self.assertEqual(len(self.conn.execs), 1)
+                    self.conn.execs[0].assertEqual(Request.get_json(uri=expected_uri), self)
 
     def test_get_config_no_value_ok(self):
-        self.conn.set_responses(Response.with_json(status_code=200, json={'result': {}}))
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
+        repo = self.repo_with_responses(Response.with_json(status_code=200, json={'result': {}}), data=self.repo_server_data)
         value = repo.get_config('THE_KEY')
 
         self.assertIsNone(value)
         self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}/config/THE_KEY'), self)
 
-    def test_get_config_error(self):
-        messages = LogBuilder(exception='Get Config Error').get_contents()
-
-        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-
-        with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
-            repo.get_config('THE_KEY')
-
-        self.assertEqual(str(caught.exception), 'gCTS exception: Get Config Error')
-
     def test_repo_without_config(self):
         data = dict(self.repo_server_data)
         del data['config']
 
-        self.conn.set_responses(Response.with_json(status_code=200, json={"result": data}))
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
+        repo = self.repo_with_responses(Response.with_json(status_code=200, json={"result": data}))
 
         self.assertEqual(repo.configuration, {})
 
-    def test_delete_config_ok(self):
-        key = 'CLIENT_VCS_URI'
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-        repo.delete_config(key)
-
-        expected_repo_config = {'VCS_CONNECTION': 'SSL', 'CLIENT_VCS_URI': ''}
-        self.assertEqual(repo.configuration, expected_repo_config)
-        self.conn.execs[0].assertEqual(Request.delete(f'repository/{self.repo_rid}/config/{key}'), self)
+    def test_delete_config(self):
+        for key in ['CLIENT_VCS_URI', 'THE_KEY']:
+            with self.subTest(key=key):
+                self.conn = RESTConnection()
+                repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
+                repo.delete_config(key)
 
-    def test_delete_config_key_not_in_config_ok(self):
-        key = 'THE_KEY'
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-        repo.delete_config(key)
-
-        self.conn.execs[0].assertEqual(Request.delete(f'repository/{self.repo_rid}/config/{key}'), self)
+                expected_repo_config = {'VCS_CONNECTION': 'SSL', 'CLIENT_VCS_URI': ''}
+                self.assertEqual(repo.configuration, expected_repo_config)
+                self.conn.execs[0].assertEqual(Request.delete(f'repository/{self.repo_rid}/config/{key}'), self)
 
     def test_clone_ok(self):
         repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
@@ -382,26 +332,16 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         self.assertIsNone(repo._data)
 
         self.assertEqual(len(self.conn.execs), 1)
-        self.conn.execs[0].assertEqual(Request.post(uri=f'repository/{self.repo_rid}/clone'), self)
-
-    def test_clone_error(self):
-        messages = LogBuilder(exception='Clone Error').get_contents()
-        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-        with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
-            repo.clone()
-
-        self.assertIsNotNone(repo._data)
-        self.assertEqual(str(caught.exception), 'gCTS exception: Clone Error')
+        self.conn.execs[0].assertEqual(_CLONE_REPO_REQ, self)
 
     def test_checkout_ok(self):
-        self.conn.set_responses(Response.with_json(status_code=200, json={'result': {
-            'fromCommit': '123',
-            'toCommit': '456'
-        }}))
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
+        repo = self.repo_with_responses(
+            Response.with_json(status_code=200, json={'result': {
+                'fromCommit': '123',
+                'toCommit': '456'
+            }}),
+            data=self.repo_server_data
+        )
         repo.checkout('the_other_branch')
 
         self.assertIsNone(repo._data)
@@ -409,17 +349,6 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         self.assertEqual(len(self.conn.execs), 1)
         self.conn.execs[0].assertEqual(Request.get(adt_uri=f'repository/{self.repo_rid}/branches/the_branch/switch', params={'branch': 'the_other_branch'}), self)
 
-    def test_checkout_error(self):
-        messages = LogBuilder(exception='Checkout Error').get_contents()
-        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-        with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
-            repo.checkout('the_other_branch')
-
-        self.assertIsNotNone(repo._data)
-        self.assertEqual(str(caught.exception), 'gCTS exception: Checkout Error')
-
     def test_delete_ok(self):
         repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
         repo.delete()
@@ -429,27 +358,15 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         self.assertEqual(len(self.conn.execs), 1)
         self.conn.execs[0].assertEqual(Request(method='DELETE', adt_uri=f'repository/{self.repo_rid}', params=None, headers=None, body=None), self)
 
-    def test_delete_error(self):
-        messages = LogBuilder(exception='Delete Error').get_contents()
-        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-        with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
-            repo.delete()
-
-        self.assertIsNotNone(repo._data)
-        self.assertEqual(str(caught.exception), 'gCTS exception: Delete Error')
-
     def test_log_ok(self):
         exp_commits = [{'id': '123'}]
 
-        self.conn.set_responses(
+        repo = self.repo_with_responses(
             Response.with_json(status_code=200, json={
                 'commits': exp_commits
-            })
+            }),
+            data=self.repo_server_data
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
         act_commits = repo.log()
 
         self.assertIsNotNone(repo._data)
@@ -458,28 +375,16 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         self.assertEqual(len(self.conn.execs), 1)
         self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}/getCommit'), self)
 
-    def test_log_error(self):
-        messages = LogBuilder(exception='Log Error').get_contents()
-        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-        with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
-            repo.log()
-
-        self.assertIsNotNone(repo._data)
-        self.assertEqual(str(caught.exception), 'gCTS exception: Log Error')
-
     def test_pull(self):
         exp_log = {
             'fromCommit': '123',
             'toCommit': '456'
         }
 
-        self.conn.set_responses(
-            Response.with_json(status_code=200, json=exp_log )
+        repo = self.repo_with_responses(
+            Response.with_json(status_code=200, json=exp_log ),
+            data=self.repo_server_data
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
         act_log = repo.pull()
 
         self.assertIsNone(repo._data)
@@ -488,59 +393,59 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         self.assertEqual(len(self.conn.execs), 1)
         self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}/pullByCommit'), self)
 
-    def test_pull_error(self):
-        messages = LogBuilder(exception='Pull Error').get_contents()
-        self.conn.set_responses(
-            Response.with_json(status_code=500, json=messages)
-        )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=self.repo_server_data)
-        with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
-            repo.pull()
-
-        self.assertIsNotNone(repo._data)
-        self.assertEqual(str(caught.exception), 'gCTS exception: Pull Error')
-
-    def assert_repo_activities(self, query_params, expected_result, expected_params):
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
-        result = repo.activities(query_params)
-
-        self.assertEqual(result, expected_result)
-        self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}/getHistory',
-                                                        params=expected_params), self)
-
-    def test_activities_default_params(self):
-        expected_params = {'limit': '10', 'offset': '0'}
-        expected_result = ['activity']
-        query_params = sap.rest.gcts.remote_repo.RepoActivitiesQueryParams()
-        self.conn.set_responses(
-            Response.with_json(status_code=200, json={'result': expected_result})
-        )
-
-        self.assert_repo_activities(query_params, expected_result, expected_params)
-
-    def test_activities_all_params(self):
-        expected_params = {'limit': '15', 'offset': '10', 'toCommit': '123', 'fromCommit': '456', 'type': 'CLONE'}
-        expected_result = ['activity']
+    def test_request_error(self):
+        # (gCTS error messages, repository data, action)
+        cases = [
+            (_GET_REPO_ERR_MSGS, None, lambda repo: repo.name),
+            (_SET_CONFIG_ERR_MSGS, None, lambda repo: repo.set_config('THE_KEY', 'the value')),
+            (_GET_CONFIG_ERR_MSGS, self.repo_server_data, lambda repo: repo.get_config('THE_KEY')),
+            (_CLONE_ERR_MSGS, self.repo_server_data, lambda repo: repo.clone()),
+            (_CHECKOUT_ERR_MSGS, self.repo_server_data, lambda repo: repo.checkout('the_other_branch')),
+            (_DELETE_ERR_MSGS, self.repo_server_data, lambda repo: repo.delete()),
+            (_LOG_ERR_MSGS, self.repo_server_data, lambda repo: repo.log()),
+            (_PULL_ERR_MSGS, self.repo_server_data, lambda repo: repo.pull()),
+        ]
 
-        query_params = sap.rest.gcts.remote_repo.RepoActivitiesQueryParams().set_limit(15).set_offset(10)\
-            .set_tocommit('123').set_fromcommit('456').set_operation('CLONE')
-        self.conn.set_responses(
-            Response.with_json(status_code=200, json={'result': expected_result})
-        )
+        for messages, data, action in cases:
+            exception = messages['exception']
+            with self.subTest(exception=exception):
+                repo = self.repo_with_responses(Response.with_json(status_code=500, json=messages), data=data)
+                with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
+                    action(repo)
+
+                if data is not None:
+                    self.assertIsNotNone(repo._data)
+
+                self.assertEqual(str(caught.exception), f'gCTS exception: {exception}')
+
+    def test_activities(self):
+        # (query parameters, response JSON, expected result, expected HTTP parameters)
+        cases = [
+            (sap.rest.gcts.remote_repo.RepoActivitiesQueryParams(),
+             {'result': ['activity']},
+             ['activity'],
+             {'limit': '10', 'offset': '0'}),
+            (sap.rest.gcts.remote_repo.RepoActivitiesQueryParams().set_limit(15).set_offset(10)
+                .set_tocommit('123').set_fromcommit('456').set_operation('CLONE'),
+             {'result': ['activity']},
+             ['activity'],
+             {'limit': '15', 'offset': '10', 'toCommit': '123', 'fromCommit': '456', 'type': 'CLONE'}),
+            (sap.rest.gcts.remote_repo.RepoActivitiesQueryParams(),
+             {},
+             [],
+             {'limit': '10', 'offset': '0'}),
+        ]
 
-        self.assert_repo_activities(query_params, expected_result, expected_params)
+        for query_params, response, expected_result, expected_params in cases:
+            with self.subTest(params=expected_params, response=response):
+                self.conn = RESTConnection()
+                repo = self.repo_with_responses(Response.with_json(status_code=200, json=response))
+                result = repo.activities(query_params)
 
-    def test_activities_empty_response(self):
-        expected_params = {'limit': '10', 'offset': '0'}
-        expected_result = []
-
-        query_params = sap.rest.gcts.remote_repo.RepoActivitiesQueryParams()
-        self.conn.set_responses(
-            Response.with_json(status_code=200, json={})
-        )
-
-        self.assert_repo_activities(query_params, expected_result, expected_params)
+                self.assertEqual(result, expected_result)
+                self.assertEqual(len(self.conn.execs), 1)
+                self.conn.execs[0].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}/getHistory',
+                                                                 params=expected_params), self)
 
     def test_activities_empty_result(self):
         query_params = sap.rest.gcts.remote_repo.RepoActivitiesQueryParams()
@@ -605,16 +510,15 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         CALL_ID_SET_URL = 1
         NEW_URL = 'https://random.github.org/awesome/success'
 
-        self.conn.set_responses(
-            Response.with_json(status_code=200, json={'result': self.repo_server_data}),
+        repo = self.repo_with_responses(
+            # set_item() updates the fetched data
+            Response.with_json(status_code=200, json={'result': copy.deepcopy(self.repo_server_data)}),
             Response.ok()
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=None)
         response = repo.set_url(NEW_URL)
 
         self.conn.execs[CALL_ID_FETCH_REPO_DATA].assertEqual(
-            Request.get_json(uri=f'repository/{self.repo_rid}'),
+            _GET_REPO_REQ,
             self
         )
 
@@ -632,15 +536,13 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         CALL_ID_FETCH_REPO_DATA = 0
         NEW_URL = self.repo_server_data['url']
 
-        self.conn.set_responses(
+        repo = self.repo_with_responses(
             Response.with_json(status_code=200, json={'result': self.repo_server_data}),
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=None)
         response = repo.set_url(NEW_URL)
 
         self.conn.execs[CALL_ID_FETCH_REPO_DATA].assertEqual(
-            Request.get_json(uri=f'repository/{self.repo_rid}'),
+            _GET_REPO_REQ,
             self
         )
 
@@ -653,16 +555,15 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         property_name = 'name'
         new_value = 'new_name'
 
-        self.conn.set_responses(
-            Response.with_json(status_code=200, json={'result': self.repo_server_data}),
+        repo = self.repo_with_responses(
+            # set_item() updates the fetched data
+            Response.with_json(status_code=200, json={'result': copy.deepcopy(self.repo_server_data)}),
             Response.ok()
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=None)
         response = repo.set_item(property_name, new_value)
 
         self.conn.execs[CALL_ID_FETCH_REPO_DATA].assertEqual(
-            Request.get_json(uri=f'repository/{self.repo_rid}'),
+            _GET_REPO_REQ,
             self
         )
 
@@ -695,15 +596,13 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         property_name = 'rid'
         new_value = self.repo_rid
 
-        self.conn.set_responses(
+        repo = self.repo_with_responses(
             Response.with_json(status_code=200, json={'result': self.repo_server_data}),
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=None)
         response = repo.set_item(property_name, new_value)
 
         self.conn.execs[CALL_ID_FETCH_REPO_DATA].assertEqual(
-            Request.get_json(uri=f'repository/{self.repo_rid}'),
+            _GET_REPO_REQ,
             self
         )
 
@@ -712,12 +611,11 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
     def test_set_role(self):
         CALL_ID_SET_ROLE = 1
 
-        self.conn.set_responses(
-            Response.with_json(status_code=200, json={'result': self.repo_server_data}),
+        repo = self.repo_with_responses(
+            # set_item() updates the fetched data
+            Response.with_json(status_code=200, json={'result': copy.deepcopy(self.repo_server_data)}),
             Response.ok()
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=None)
         response = repo.set_role('TARGET')
 
         self.conn.execs[CALL_ID_SET_ROLE].assertEqual(
@@ -738,11 +636,9 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
             'ref': f'/refs/heads/{branch_name}',
         }
 
-        self.conn.set_responses(
+        repo = self.repo_with_responses(
             Response.with_json(status_code=200, json={'branch': expected_response})
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
         response = repo.create_branch(branch_name)
 
         self.conn.execs[0].assertEqual(
@@ -766,11 +662,9 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
             'ref': f'/refs/heads/{branch_name}',
         }
 
-        self.conn.set_responses(
+        repo = self.repo_with_responses(
             Response.with_json(status_code=200, json={'branch': expected_response})
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
         response = repo.create_branch(branch_name, symbolic=True, peeled=True, local_only=True)
 
         self.conn.execs[0].assertEqual(
@@ -787,11 +681,9 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
     def test_delete_branch(self):
         branch_name = 'branch'
 
-        self.conn.set_responses(
+        repo = self.repo_with_responses(
             Response.with_json(status_code=200, json={})
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
         response = repo.delete_branch(branch_name)
 
         self.conn.execs[0].assertEqual(
@@ -808,10 +700,9 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
                     {'name': 'branch1', 'type': 'remote', 'isSymbolic': False, 'isPeeled': False,
                      'ref': 'refs/remotes/origin/branch1'}]
 
-        self.conn.set_responses(
+        repo = self.repo_with_responses(
             Response.with_json(status_code=200, json={'branches': branches})
         )
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
         response = repo.list_branches()
 
         self.conn.execs[0].assertEqual(
@@ -821,15 +712,13 @@ class TestGCTSRepostiroy(GCTSTestSetUp, unittest.TestCase):
         self.assertEqual(response, branches)
 
     def test_list_branches_wrong_response(self):
-        self.conn.set_responses(
+        repo = self.repo_with_responses(
             Response.with_json(status_code=200, json={})
         )
-
-        repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid)
         with self.assertRaises(sap.rest.errors.SAPCliError) as cm:
             repo.list_branches()
 
-        self.assertEqual(str(cm.exception), "gCTS response does not contain 'branches'")
+        self.assertEqual(str(cm.exception), _ERR_NO_BRANCHES)
 
 
 class TestRepoActivitiesQueryParams(unittest.TestCase):
@@ -845,17 +734,33 @@ class TestRepoActivitiesQueryParams(unittest.TestCase):
 
     def test_set_operation_valid(self):
         for operation in sap.rest.gcts.remote_repo.RepoActivitiesQueryParams.allowed_operations():
-            self.params.set_operation(operation)
+            with self.subTest(operation=operation):
+                self.params.set_operation(operation)
 
 
 class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        log_builder = LogBuilder()
+        log_builder.log_error(make_gcts_log_error('20200923111743: Error action CREATE_REPOSITORY Repository already exists'))
+        log_builder.log_exception('Cannot create', 'EEXIST')
+        cls.exists_messages = log_builder.get_contents()
+
+        # The fake Response only keeps the payload, so it can be shared too
+        cls.repo_ready_response = Response.with_json(status_code=200, json={'result': cls.repo_server_data})
+
+        cls.user_credentials = [{"domain": "url", "endpointType": "THETYPE", "subDomain": "api.url",
+                                 "endpoint": "https://api.url", "type": "token", "state": "false"}]
+        cls.user_credentials_json = json.dumps(cls.user_credentials)
+
     def test_simple_clone_success(self):
         CALL_ID_CREATE = 0
         CALL_ID_CLONE = 1
 
-        repository = dict(self.repo_server_data)
-        repository['status'] = 'CREATED'
+        repository = self._repo_with(status='CREATED')
 
         self.conn.set_responses(
             Response.with_json(status_code=201, json={'repository': repository}),
@@ -869,21 +774,15 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
             vcs_token='THE_TOKEN'
         )
 
-        data = dict(self.repo_data)
-        data['config'] = [
+        request_load = self._build_repo_request(config=[
             {'key': 'VCS_TARGET_DIR', 'value': 'src/'},
             {'key': 'CLIENT_VCS_AUTH_TOKEN', 'value': 'THE_TOKEN'}
-        ]
-
-        request_load = {
-            'repository': self.repo_rid,
-            'data': data
-        }
+        ])
 
         self.assertEqual(len(self.conn.execs), 2)
 
         self.conn.execs[CALL_ID_CREATE].assertEqual(Request.post_json(uri='repository', body=request_load, accept='application/json'), self, json_body=True)
-        self.conn.execs[CALL_ID_CLONE].assertEqual(Request.post(uri=f'repository/{self.repo_rid}/clone'), self)
+        self.conn.execs[CALL_ID_CLONE].assertEqual(_CLONE_REPO_REQ, self)
 
     @patch('sap.rest.gcts.remote_repo.Repository.is_cloned', new_callable=PropertyMock)
     @patch('sap.rest.gcts.remote_repo.Repository.create')
@@ -913,7 +812,7 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         log_builder = LogBuilder()
         messages = log_builder.log_error(make_gcts_log_error('Failure')).log_exception('Message', 'EERROR').get_contents()
 
-        self.conn.set_responses([Response.with_json(status_code=500, json=messages)])
+        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
 
         with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
             sap.rest.gcts.simple.clone(self.conn, self.repo_url, self.repo_rid)
@@ -921,12 +820,7 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         self.assertEqual(str(caught.exception), 'gCTS exception: Message')
 
     def test_simple_clone_without_params_create_exists(self):
-        log_builder = LogBuilder()
-        log_builder.log_error(make_gcts_log_error('20200923111743: Error action CREATE_REPOSITORY Repository already exists'))
-        log_builder.log_exception('Cannot create', 'EEXIST').get_contents()
-        messages = log_builder.get_contents()
-
-        self.conn.set_responses([Response.with_json(status_code=500, json=messages)])
+        self.conn.set_responses(Response.with_json(status_code=500, json=self.exists_messages))
 
         with self.assertRaises(sap.rest.gcts.errors.GCTSRepoAlreadyExistsError) as caught:
             sap.rest.gcts.simple.clone(self.conn, self.repo_url, self.repo_rid)
@@ -936,75 +830,62 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
     def test_simple_clone_without_params_create_exists_continue(self):
         CALL_ID_FETCH_REPO_DATA = 1
 
-        log_builder = LogBuilder()
-        log_builder.log_error(make_gcts_log_error('20200923111743: Error action CREATE_REPOSITORY Repository already exists'))
-        log_builder.log_exception('Cannot create', 'EEXIST').get_contents()
-        messages = log_builder.get_contents()
-
-        new_repo_data = dict(self.repo_server_data)
-        new_repo_data['status'] = 'CREATED'
+        new_repo_data = self._repo_with(status='CREATED')
 
-        self.conn.set_responses([
-            Response.with_json(status_code=500, json=messages),
+        self.conn.set_responses(
+            Response.with_json(status_code=500, json=self.exists_messages),
             Response.with_json(status_code=200, json={'result': new_repo_data}),
             Response.ok()
-        ])
+        )
 
         repo = sap.rest.gcts.simple.clone(self.conn, self.repo_url, self.repo_rid, error_exists=False)
         self.assertIsNotNone(repo)
         self.assertEqual(len(self.conn.execs), 3)
-        self.conn.execs[CALL_ID_FETCH_REPO_DATA].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}'), self)
+        self.conn.execs[CALL_ID_FETCH_REPO_DATA].assertEqual(_GET_REPO_REQ, self)
 
     def test_simple_clone_without_params_create_exists_continue_cloned(self):
         CALL_ID_FETCH_REPO_DATA = 1
 
-        log_builder = LogBuilder()
-        log_builder.log_error(make_gcts_log_error('20200923111743: Error action CREATE_REPOSITORY Repository already exists'))
-        log_builder.log_exception('Cannot create', 'EEXIST').get_contents()
-        messages = log_builder.get_contents()
-
         self.assertEqual(self.repo_server_data['status'], 'READY')
 
-        self.conn.set_responses([
-            Response.with_json(status_code=500, json=messages),
-            Response.with_json(status_code=200, json={'result': self.repo_server_data}),
-        ])
+        self.conn.set_responses(
+            Response.with_json(status_code=500, json=self.exists_messages),
+            self.repo_ready_response,
+        )
 
         repo = sap.rest.gcts.simple.clone(self.conn, self.repo_url, self.repo_rid, error_exists=False)
         self.assertIsNotNone(repo)
 
         self.assertEqual(len(self.conn.execs), 2)
-        self.conn.execs[CALL_ID_FETCH_REPO_DATA].assertEqual(Request.get_json(uri=f'repository/{self.repo_rid}'), self)
+        self.conn.execs[CALL_ID_FETCH_REPO_DATA].assertEqual(_GET_REPO_REQ, self)
 
     @patch('sap.rest.gcts.simple._mod_log')
-    def test_simple_wait_for_clone(self, fake_mod_log):
-        repository = dict(self.repo_server_data)
-        repository['status'] = 'CREATED'
+    @patch('sap.rest.gcts.simple.time.time', return_value=0)
+    def test_simple_wait_for_clone(self, _, fake_mod_log):
+        repository = self._repo_with(status='CREATED')
 
         repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=repository)
         repo.wipe_data = Mock(side_effect=repo.wipe_data)
 
-        self.conn.set_responses([
-            Response.with_json(status_code=200, json={'result': self.repo_server_data})
-        ])
+        self.conn.set_responses(self.repo_ready_response)
 
         sap.rest.gcts.simple.wait_for_clone(repo, 10, None)
         repo.wipe_data.assert_called_once()
         fake_mod_log.return_value.debug.assert_not_called()
 
     @patch('sap.rest.gcts.simple._mod_log')
-    def test_simple_wait_for_clone_with_retries(self, fake_mod_log):
-        repository = dict(self.repo_server_data)
-        repository['status'] = 'CREATED'
+    @patch('sap.rest.gcts.simple.time.time', return_value=0)
+    def test_simple_wait_for_clone_with_retries(self, _, fake_mod_log):
+        repository = self._repo_with(status='CREATED')
 
         repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=repository)
         repo.wipe_data = Mock(side_effect=repo.wipe_data)
 
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response(status_code=500, text='Test HTTP Request Exception'),
             Response.with_json(status_code=200, json={'result': repository}),
-            Response.with_json(status_code=200, json={'result': self.repo_server_data})
-        ])
+            self.repo_ready_response
+        )
 
         sap.rest.gcts.simple.wait_for_clone(repo, 10, None)
         self.assertEqual(repo.wipe_data.mock_calls, [call(), call(), call()])
@@ -1012,14 +893,13 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
 
     @patch('sap.rest.gcts.simple.time.time')
     def test_simple_wait_for_clone_timeout(self, fake_time):
-        repository = dict(self.repo_server_data)
-        repository['status'] = 'CREATED'
+        repository = self._repo_with(status='CREATED')
 
         fake_time.side_effect = [0, 1, 2]
 
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json(status_code=200, json={'result': repository}),
-        ])
+        )
 
         repo = sap.rest.gcts.remote_repo.Repository(self.conn, self.repo_rid, data=repository)
         http_error = HTTPRequestError(None, Response(status_code=500, text='Test HTTP Request Exception'))
@@ -1027,8 +907,7 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         with self.assertRaises(sap.rest.errors.SAPCliError) as cm:
             sap.rest.gcts.simple.wait_for_clone(repo, 2, http_error)
 
-        self.assertEqual(str(cm.exception), 'Waiting for the repository to be in READY state timed out\n'
-                                            '500\nTest HTTP Request Exception')
+        self.assertEqual(str(cm.exception), _ERR_WAIT_TIMEOUT)
 
     def test_simple_fetch_no_repo(self):
         self.conn.set_responses(
@@ -1040,12 +919,10 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
 
     def test_simple_fetch_ok(self):
         REPO_ONE_ID=0
-        repo_one = dict(self.repo_server_data)
-        repo_one['name'] = repo_one['rid'] = 'one'
+        repo_one = self._repo_with(name='one', rid='one')
 
         REPO_TWO_ID=1
-        repo_two = dict(self.repo_server_data)
-        repo_two['name'] = repo_two['rid'] = 'two'
+        repo_two = self._repo_with(name='two', rid='two')
 
         self.conn.set_responses(
             Response.with_json(status_code=200, json={'result':
@@ -1064,124 +941,78 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
 
 
     def test_simple_fetch_error(self):
-        messages = LogBuilder(exception='Fetch Error').get_contents()
-        self.conn.set_responses(Response.with_json(status_code=500, json=messages))
+        self.conn.set_responses(Response.with_json(status_code=500, json=_FETCH_ERR_MSGS))
 
         with self.assertRaises(sap.rest.gcts.errors.GCTSRequestError) as caught:
             sap.rest.gcts.simple.fetch_repos(self.conn)
 
         self.assertEqual(str(caught.exception), 'gCTS exception: Fetch Error')
 
-    @patch('sap.rest.gcts.simple.Repository')
-    def test_simple_checkout_ok(self, fake_repository):
-        fake_instance = Mock()
-        fake_repository.return_value = fake_instance
-        fake_instance.checkout = Mock()
-        fake_instance.checkout.return_value = 'probe'
+    def test_simple_delegation(self):
+        for op, args in [('checkout', ('the_new_branch',)), ('delete', ()), ('log', ()), ('pull', ())]:
+            with self.subTest(op=op), patch('sap.rest.gcts.simple.Repository', spec=True) as fake_repository:
+                fake_instance = fake_repository.return_value
+                getattr(fake_instance, op).return_value = 'probe'
 
-        response = sap.rest.gcts.simple.checkout(self.conn, 'the_new_branch', rid=self.repo_rid)
-        fake_repository.assert_called_once_with(self.conn, self.repo_rid)
-        fake_instance.checkout.assert_called_once_with('the_new_branch')
-        self.assertEqual(response, 'probe')
-
-    @patch('sap.rest.gcts.simple.Repository')
-    def test_simple_delete_name(self, fake_repository):
-        fake_instance = Mock()
-        fake_repository.return_value = fake_instance
-        fake_instance.delete = Mock()
-        fake_instance.delete.return_value = 'probe'
-
-        response = sap.rest.gcts.simple.delete(self.conn, rid=self.repo_rid)
-        fake_repository.assert_called_once_with(self.conn, self.repo_rid)
-        fake_instance.delete.assert_called_once_with()
-        self.assertEqual(response, 'probe')
+                response = getattr(sap.rest.gcts.simple, op)(self.conn, *args, rid=self.repo_rid)
+                fake_repository.assert_called_once_with(self.conn, self.repo_rid)
+                getattr(fake_instance, op).assert_called_once_with(*args)
+                self.assertEqual(response, 'probe')
 
     def test_simple_delete_repo(self):
-        fake_instance = Mock()
+        fake_instance = Mock(spec=sap.rest.gcts.remote_repo.Repository)
         fake_instance.delete.return_value = 'probe'
 
         response = sap.rest.gcts.simple.delete(None, repo=fake_instance)
         self.assertEqual(response, 'probe')
 
-    @patch('sap.rest.gcts.simple.Repository')
-    def test_simple_log_name(self, fake_repository):
-        fake_instance = Mock()
-        fake_repository.return_value = fake_instance
-        fake_instance.log = Mock()
-        fake_instance.log.return_value = 'probe'
-
-        response = sap.rest.gcts.simple.log(self.conn, rid=self.repo_rid)
-        fake_repository.assert_called_once_with(self.conn, self.repo_rid)
-        fake_instance.log.assert_called_once_with()
-        self.assertEqual(response, 'probe')
-
     def test_simple_log_repo(self):
-        fake_instance = Mock()
-        fake_instance.log = Mock()
+        fake_instance = Mock(spec=sap.rest.gcts.remote_repo.Repository)
         fake_instance.log.return_value = 'probe'
 
         response = sap.rest.gcts.simple.log(None, repo=fake_instance)
         self.assertEqual(response, 'probe')
 
-    @patch('sap.rest.gcts.simple.Repository')
-    def test_simple_pull_name(self, fake_repository):
-        fake_instance = Mock()
-        fake_repository.return_value = fake_instance
-        fake_instance.pull = Mock()
-        fake_instance.pull.return_value = 'probe'
-
-        response = sap.rest.gcts.simple.pull(self.conn, rid=self.repo_rid)
-        fake_repository.assert_called_once_with(self.conn, self.repo_rid)
-        fake_instance.pull.assert_called_once_with()
-        self.assertEqual(response, 'probe')
-
     def test_simple_pull_repo(self):
-        fake_instance = Mock()
-        fake_instance.pull = Mock()
+        fake_instance = Mock(spec=sap.rest.gcts.remote_repo.Repository)
         fake_instance.pull.return_value = 'probe'
 
         response = sap.rest.gcts.simple.pull(None, repo=fake_instance)
         self.assertEqual(response, 'probe')
 
     def test_simple_get_user_credentials(self):
-        user_credentials = [{"domain": "url", "endpointType": "THETYPE", "subDomain": "api.url",
-                             "endpoint": "https://api.url", "type": "token", "state": "false"}]
-
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json(json={
                 'user': {
-                    'config': [{'key': 'USER_AUTH_CRED_ENDPOINTS', 'value': json.dumps(user_credentials)}]
+                    'config': [{'key': 'USER_AUTH_CRED_ENDPOINTS', 'value': self.user_credentials_json}]
                 }
             })
-        ])
+        )
 
         response = sap.rest.gcts.simple.get_user_credentials(self.conn)
 
         self.assertEqual(self.conn.mock_methods(), [('GET', 'user')])
-        self.conn.execs[0].assertEqual(
-            Request.get_json(uri='user'),
-            self
-        )
+        self.conn.execs[0].assertEqual(_GET_USER_REQ, self)
 
-        self.assertEqual(response, user_credentials)
+        self.assertEqual(response, self.user_credentials)
 
     def test_simple_get_user_credentials_no_user_data(self):
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json(json={})
-        ])
+        )
 
         with self.assertRaises(sap.rest.errors.SAPCliError) as cm:
             sap.rest.gcts.simple.get_user_credentials(self.conn)
 
         self.assertEqual(self.conn.mock_methods(), [('GET', 'user')])
-        self.assertEqual(str(cm.exception), 'gCTS response does not contain \'user\'')
+        self.assertEqual(str(cm.exception), _ERR_NO_USER)
 
     def test_simple_get_user_credentials_no_config_data(self):
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json(json={
                 'user': {}
             })
-        ])
+        )
 
         response = sap.rest.gcts.simple.get_user_credentials(self.conn)
 
@@ -1189,14 +1020,12 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         self.assertEqual(response, [])
 
     def test_simple_set_user_api_token(self):
-        connection = RESTConnection()
-
         api_url = 'https://api.url/'
         token = 'THETOKEN'
-        response = sap.rest.gcts.simple.set_user_api_token(connection, api_url, token)
+        response = sap.rest.gcts.simple.set_user_api_token(self.conn, api_url, token)
 
-        self.assertEqual(connection.mock_methods(), [('POST', 'user/credentials')])
-        connection.execs[0].assertEqual(
+        self.assertEqual(self.conn.mock_methods(), [('POST', 'user/credentials')])
+        self.conn.execs[0].assertEqual(
             Request.post_json(
                 uri='user/credentials',
                 body={
@@ -1240,9 +1069,9 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
             'value': 'the_value'
         }
 
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json({'result': expected_response})
-        ])
+        )
 
         response = sap.rest.gcts.simple.get_system_config_property(self.conn, config_key)
         self.assertEqual(response, expected_response)
@@ -1255,14 +1084,14 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         )
 
     def test_simple_get_system_config_property_no_result(self):
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json({})
-        ])
+        )
 
         with self.assertRaises(sap.rest.errors.SAPCliError) as cm:
             sap.rest.gcts.simple.get_system_config_property(self.conn, 'THE_KEY')
 
-        self.assertEqual(str(cm.exception), "gCTS response does not contain 'result'")
+        self.assertEqual(str(cm.exception), _ERR_NO_RESULT)
 
     def test_simple_list_system_config(self):
         expected_response = [
@@ -1281,9 +1110,9 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
                 'changedBy': 'TEST',
             }
         ]
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json({'result': {'config': expected_response}})
-        ])
+        )
 
         response = sap.rest.gcts.simple.list_system_config(self.conn)
         self.assertEqual(response, expected_response)
@@ -1294,9 +1123,9 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         )
 
     def test_simple_list_system_config_no_config(self):
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json({'result': {}})
-        ])
+        )
 
         response = sap.rest.gcts.simple.list_system_config(self.conn)
         self.assertEqual(response, [])
@@ -1307,14 +1136,14 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         )
 
     def test_simple_list_system_config_no_result(self):
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json({})
-        ])
+        )
 
         with self.assertRaises(sap.rest.errors.SAPCliError) as cm:
             sap.rest.gcts.simple.list_system_config(self.conn)
 
-        self.assertEqual(str(cm.exception), "gCTS response does not contain 'result'")
+        self.assertEqual(str(cm.exception), _ERR_NO_RESULT)
 
     def test_simple_set_system_config_property(self):
         config_key = 'THE_KEY'
@@ -1324,9 +1153,9 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
             'value': value
         }
 
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json({'result': expected_response})
-        ])
+        )
 
         response = sap.rest.gcts.simple.set_system_config_property(self.conn, config_key, value)
         self.assertEqual(response, expected_response)
@@ -1340,20 +1169,20 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         )
 
     def test_simple_set_system_config_property_no_result(self):
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json({})
-        ])
+        )
 
         with self.assertRaises(sap.rest.errors.SAPCliError) as cm:
             sap.rest.gcts.simple.set_system_config_property(self.conn, 'THE_KEY', 'the_value')
 
-        self.assertEqual(str(cm.exception), "gCTS response does not contain 'result'")
+        self.assertEqual(str(cm.exception), _ERR_NO_RESULT)
 
     def test_simple_delete_system_config_property(self):
         config_key = 'THE_KEY'
-        self.conn.set_responses([
+        self.conn.set_responses(
             Response.with_json({})
-        ])
+        )
 
         response = sap.rest.gcts.simple.delete_system_config_property(self.conn, config_key)
         self.assertEqual(response, {})
@@ -1367,16 +1196,30 @@ class TestgCTSSimpleAPI(GCTSTestSetUp, unittest.TestCase):
         )
 
 
-class TestgCTSSugar(GCTSTestSetUp, unittest.TestCase):
+class TestgCTSSugar(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.new_branch = 'new_branch'
+        cls.msg_already_active = f'The updated branch {cls.new_branch} is already active'
+        cls.msg_remains_active = f'The updated branch {cls.new_branch} remains active'
+
+        cls.get_logger_patcher = patch('sap.rest.gcts.sugar.get_logger')
+        cls.fake_get_logger = cls.get_logger_patcher.start()
+        cls.fake_log_info = cls.fake_get_logger.return_value.info
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.get_logger_patcher.stop()
+        super().tearDownClass()
 
     def setUp(self):
-        self.fake_repo = Mock()
+        self.fake_repo = Mock(spec=sap.rest.gcts.remote_repo.Repository)
         self.progress = sap.rest.gcts.sugar.LogSugarOperationProgress()
-        self.new_branch = 'new_branch'
 
-        self.fake_log_info = Mock()
-        fake_get_logger = patch('sap.rest.gcts.sugar.get_logger').start()
-        fake_get_logger.return_value.info = self.fake_log_info
+        self.fake_get_logger.reset_mock()
 
     @patch.multiple(sap.rest.gcts.sugar.SugarOperationProgress, __abstractmethods__=set())
     def test_sugar_operation_progress(self):
@@ -1398,23 +1241,30 @@ class TestgCTSSugar(GCTSTestSetUp, unittest.TestCase):
         self.assertEqual(self.progress.recover_message, recover_msg)
         self.fake_log_info.assert_called_once_with(log_msg)
 
-    def test_abap_modifications_disabled_reset(self):
-        self.fake_repo.get_config.return_value = ''
+    def _assert_abap_mods_disabled(self, initial, enter_msg, exit_msgs, recover):
+        self.fake_repo.get_config.return_value = initial
 
         with sap.rest.gcts.sugar.abap_modifications_disabled(self.fake_repo, self.progress):
             log_info_calls = [call('Disabling imports by setting the config VCS_NO_IMPORT = "X" ...'),
-                              call('Successfully changed the config VCS_NO_IMPORT = "" -> "X"')]
+                              call(enter_msg)]
             self.fake_log_info.assert_has_calls(log_info_calls)
             self.fake_repo.set_config.assert_called_once_with('VCS_NO_IMPORT', 'X')
-            self.assertEqual(self.progress.recover_message,
-                             'Please set the configuration option VCS_NO_IMPORT = "" manually')
+            self.assertEqual(self.progress.recover_message, recover)
 
-        log_info_calls += [call('Resetting the config VCS_NO_IMPORT = "" ...'),
-                           call('Successfully reset the config VCS_NO_IMPORT = ""')]
+        log_info_calls += [call(msg) for msg in exit_msgs]
         self.fake_log_info.assert_has_calls(log_info_calls)
-        self.fake_repo.set_config.assert_called_with('VCS_NO_IMPORT', '')
         self.assertEqual(self.progress.recover_message, None)
 
+    def test_abap_modifications_disabled_reset(self):
+        self._assert_abap_mods_disabled(
+            '',
+            'Successfully changed the config VCS_NO_IMPORT = "" -> "X"',
+            ['Resetting the config VCS_NO_IMPORT = "" ...',
+             'Successfully reset the config VCS_NO_IMPORT = ""'],
+            'Please set the configuration option VCS_NO_IMPORT = "" manually'
+        )
+        self.fake_repo.set_config.assert_called_with('VCS_NO_IMPORT', '')
+
     def test_abap_modifications_disabled_reset_error(self):
         self.fake_repo.get_config.return_value = ''
 
@@ -1427,21 +1277,14 @@ class TestgCTSSugar(GCTSTestSetUp, unittest.TestCase):
                          'Please set the configuration option VCS_NO_IMPORT = "" manually')
 
     def test_abap_modifications_disabled_delete(self):
-        self.fake_repo.get_config.return_value = None
-
-        with sap.rest.gcts.sugar.abap_modifications_disabled(self.fake_repo, self.progress):
-            log_info_calls = [call('Disabling imports by setting the config VCS_NO_IMPORT = "X" ...'),
-                              call('Successfully added the config VCS_NO_IMPORT = "X"')]
-            self.fake_log_info.assert_has_calls(log_info_calls)
-            self.fake_repo.set_config.assert_called_once_with('VCS_NO_IMPORT', 'X')
-            self.assertEqual(self.progress.recover_message,
-                             'Please delete the configuration option VCS_NO_IMPORT manually')
-
-        log_info_calls += [call('Removing the config VCS_NO_IMPORT ...'),
-                           call('Successfully removed the config VCS_NO_IMPORT')]
-        self.fake_log_info.assert_has_calls(log_info_calls)
+        self._assert_abap_mods_disabled(
+            None,
+            'Successfully added the config VCS_NO_IMPORT = "X"',
+            ['Removing the config VCS_NO_IMPORT ...',
+             'Successfully removed the config VCS_NO_IMPORT'],
+            'Please delete the configuration option VCS_NO_IMPORT manually'
+        )
         self.fake_repo.delete_config.assert_called_once_with('VCS_NO_IMPORT')
-        self.assertEqual(self.progress.recover_message, None)
 
     def test_abap_modifications_disabled_delete_error(self):
         self.fake_repo.get_config.return_value = None
@@ -1455,17 +1298,12 @@ class TestgCTSSugar(GCTSTestSetUp, unittest.TestCase):
                          'Please delete the configuration option VCS_NO_IMPORT manually')
 
     def test_abap_modifications_disabled_donothing(self):
-        self.fake_repo.get_config.return_value = 'X'
-
-        with sap.rest.gcts.sugar.abap_modifications_disabled(self.fake_repo, self.progress):
-            log_info_calls = [call('Disabling imports by setting the config VCS_NO_IMPORT = "X" ...'),
-                              call('The config VCS_NO_IMPORT was already set to "X"')]
-            self.fake_log_info.assert_has_calls(log_info_calls)
-            self.fake_repo.set_config.assert_called_once_with('VCS_NO_IMPORT', 'X')
-
-        log_info_calls += [call('The config VCS_NO_IMPORT has not beed changed')]
-        self.fake_log_info.assert_has_calls(log_info_calls)
-        self.assertEqual(self.progress.recover_message, None)
+        self._assert_abap_mods_disabled(
+            'X',
+            'The config VCS_NO_IMPORT was already set to "X"',
+            ['The config VCS_NO_IMPORT has not beed changed'],
+            None
+        )
 
     def test_abap_modifications_disabled_without_progress(self):
         self.fake_repo.get_config.return_value = 'X'
@@ -1520,23 +1358,17 @@ class TestgCTSSugar(GCTSTestSetUp, unittest.TestCase):
     def test_temporary_switched_branch_donothing(self):
         self.fake_repo.branch = self.new_branch
 
-        with sap.rest.gcts.sugar.temporary_switched_branch(self.fake_repo, self.new_branch, self.progress):
-            log_info_calls = [call(f'The updated branch {self.new_branch} is already active')]
-            self.fake_log_info.assert_has_calls(log_info_calls)
-            self.assertEqual(self.progress.recover_message, None)
+        for case, progress in [('with_progress', self.progress), ('without_progress', None)]:
+            with self.subTest(case=case):
+                self.fake_get_logger.reset_mock()
 
-        log_info_calls += [call(f'The updated branch {self.new_branch} remains active')]
-        self.fake_log_info.assert_has_calls(log_info_calls)
-        self.assertEqual(self.progress.recover_message, None)
-        self.fake_repo.checkout.assert_not_called()
+                with sap.rest.gcts.sugar.temporary_switched_branch(self.fake_repo, self.new_branch, progress):
+                    self.assertEqual(self.fake_log_info.call_args_list, [call(self.msg_already_active)])
+                    if progress is not None:
+                        self.assertEqual(progress.recover_message, None)
 
-    def test_temporary_switched_branch_without_progress(self):
-        self.fake_repo.branch = self.new_branch
-
-        with sap.rest.gcts.sugar.temporary_switched_branch(self.fake_repo, self.new_branch):
-            log_info_calls = [call(f'The updated branch {self.new_branch} is already active')]
-            self.fake_log_info.assert_has_calls(log_info_calls)
-
-        log_info_calls += [call(f'The updated branch {self.new_branch} remains active')]
-        self.fake_log_info.assert_has_calls(log_info_calls)
-        self.fake_repo.checkout.assert_not_called()
+                self.assertEqual(self.fake_log_info.call_args_list,
+                                 [call(self.msg_already_active), call(self.msg_remains_active)])
+                if progress is not None:
+                    self.assertEqual(progress.recover_message, None)
+                self.fake_repo.checkout.assert_not_called()